@@ -1,7 +1,7 @@
 """Module initializing the Flask-Viewsets package.
 
-It imports the ViewSets class from the extension module and making it available for
-import when the package is imported.
+It exposes the ViewSets class from the extension module, importing it lazily on first
+attribute access so that importing the package stays cheap.
 
 Classes:
     ViewSets: A class that provides viewset functionality for Flask applications.
@@ -11,6 +11,24 @@ __all__:
         - "ViewSets": The ViewSets class.
 """
 
-from .extension import ViewSets
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .extension import ViewSets  # noqa: TCH004
 
 __all__ = ("ViewSets",)
+
+_LAZY_ATTRIBUTES = {"ViewSets": ".extension"}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the public attributes of the package on first access (PEP 562)."""
+    if name not in _LAZY_ATTRIBUTES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
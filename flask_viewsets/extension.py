@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
+import types
 import warnings
+from functools import cache, cached_property
 from importlib.util import find_spec
-from typing import TYPE_CHECKING, TypedDict
-
-from flask import Flask
-
-from .viewsets import ModelViewSet, ViewSet
+from typing import TYPE_CHECKING, Any, Generic, TypedDict, TypeVar
 
 if TYPE_CHECKING:
     from typing import NotRequired
@@ -17,7 +15,21 @@ if TYPE_CHECKING:
     from flask_marshmallow import Marshmallow
     from flask_sqlalchemy import SQLAlchemy
 
+    from .model_viewsets import ModelViewSet
     from .typing import Model
+    from .viewsets import ViewSet
+
+
+_M = TypeVar("_M", bound="Model")
+
+
+@cache
+def _masqla_available() -> bool:
+    """Return whether the SQLAlchemy and Marshmallow integrations are installed."""
+    return all(
+        find_spec(name) is not None
+        for name in ("flask_sqlalchemy", "marshmallow_sqlalchemy", "flask_marshmallow")
+    )
 
 
 class ViewSetsConfig(TypedDict):  # noqa: D101
@@ -30,10 +42,12 @@ class ViewSets[VST: ViewSet, MVST: ModelViewSet]:
     Attributes:
         config (ViewSetsConfig): Configuration for the ViewSets extension.
         view_set_cls (type[VST]): The class to use for view sets.
-        model_view_set_cls (type[MVST]): The class to use for model view sets.
+        model_view_set_cls (type[MVST]): The class to use for model view sets, bound
+            to the extension and built on first access, so that SQLAlchemy is only
+            imported when model view sets are used.
 
     Methods:
-        __init__(app: Flask | None = None, view_set_cls: type[VST] = ViewSet, model_view_set_cls: type[MVST] = ModelViewSet, config: ViewSetsConfig | None = None) -> None:
+        __init__(app: Flask | None = None, view_set_cls: type[VST] | None = None, model_view_set_cls: type[MVST] | None = None, config: ViewSetsConfig | None = None) -> None:
             Initializes the ViewSets extension with the given parameters.
         init_app(app: Flask) -> None:
             Initializes the Flask application with the ViewSets extension.
@@ -43,8 +57,8 @@ class ViewSets[VST: ViewSet, MVST: ModelViewSet]:
     def __init__(
         self,
         app: Flask | None = None,
-        view_set_cls: type[VST] = ViewSet,
-        model_view_set_cls: type[MVST] = ModelViewSet,
+        view_set_cls: type[VST] | None = None,
+        model_view_set_cls: type[MVST] | None = None,
         config: ViewSetsConfig | None = None,
     ) -> None:
         """Initialize the ViewSets extension with the given parameters.
@@ -52,20 +66,17 @@ class ViewSets[VST: ViewSet, MVST: ModelViewSet]:
         :param app: the flask app to extend, defaults to None
         :type app: Flask | None, optional
         :param view_set_cls: a base viewset class, defaults to ViewSet
-        :type view_set_cls: type[VST], optional
+        :type view_set_cls: type[VST] | None, optional
         :param model_view_set_cls: a base model viewset class, defaults to ModelViewSet
-        :type model_view_set_cls: type[MVST], optional
+        :type model_view_set_cls: type[MVST] | None, optional
         :param config: some extension config, defaults to None
         :type config: ViewSetsConfig | None, optional
         """
-        self.config: ViewSetsConfig = config or {}
-        self.ViewSet = view_set_cls
+        from .viewsets import ViewSet
 
-        class ModelViewSet[M: Model](model_view_set_cls):
-            model: type[M]  # type: ignore[override]
-            vs: ViewSets[VST, MVST] = self
-
-        self.ModelViewSet = ModelViewSet
+        self.config: ViewSetsConfig = config or {}
+        self.ViewSet = view_set_cls or ViewSet
+        self._model_view_set_cls = model_view_set_cls
 
         if app is not None:
             self.init_app(app)
@@ -79,11 +90,7 @@ class ViewSets[VST: ViewSet, MVST: ModelViewSet]:
         self.config = app.config.get("VIEWSETS", {})  # type: ignore[partially-unknown]
         app.extensions["viewsets"] = self
 
-        if find_spec("flask_sqlalchemy") is None:
-            return
-        if find_spec("marshmallow_sqlalchemy") is None:
-            return
-        if find_spec("flask_marshmallow") is None:
+        if not _masqla_available():
             return
 
         db: SQLAlchemy | None = app.extensions.get("sqlalchemy")
@@ -101,3 +108,20 @@ class ViewSets[VST: ViewSet, MVST: ModelViewSet]:
 
         self.ModelViewSet.db = db
         self.ModelViewSet.ma = ma
+
+    @cached_property
+    def ModelViewSet(self) -> type[MVST]:  # noqa: N802
+        """Return the model viewset class bound to the extension, built once.
+
+        It is generic in the model, as a subscription of the base class when the base
+        is itself generic, or through Generic otherwise.
+        """
+        from .model_viewsets import ModelViewSet
+
+        base: Any = self._model_view_set_cls or ModelViewSet
+        bases = (base[_M],) if base.__parameters__ else (base, Generic[_M])
+        return types.new_class(
+            "ModelViewSet",
+            bases,
+            exec_body=lambda ns: ns.update(__module__=__name__, vs=self),
+        )
@@ -0,0 +1,418 @@
+"""Module defining a base class for creating model viewsets in Flask.
+
+It depends on the optional SQLAlchemy and Marshmallow integrations, so it is kept
+apart from the viewsets module and only imported when model viewsets are used.
+
+Classes:
+    ModelViewSet: A viewset providing default implementations for model CRUD
+        operations.
+    QueryParams: The query string arguments used by model viewsets to list instances.
+"""
+
+from __future__ import annotations
+
+import threading
+from abc import ABCMeta
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+from weakref import WeakKeyDictionary
+
+from flask import abort, request
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    Select,
+    select,
+)
+from sqlalchemy import inspect as sqla_inspect
+from sqlalchemy.exc import MultipleResultsFound, NoResultFound
+
+from .parsers import WhereParser, WhereSyntaxError, _get_column
+from .viewsets import ViewSet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from flask.typing import ResponseReturnValue
+    from flask_marshmallow import Marshmallow
+    from flask_sqlalchemy import SQLAlchemy
+
+    from flask_viewsets.typing import Model, ModelSchema
+
+
+_local = threading.local()
+_shared_schemas: WeakKeyDictionary[type[ModelViewSet[Any]], Any] = WeakKeyDictionary()
+
+
+def _get_count_arg(name: str) -> int | None:
+    """Return the non negative integer query argument, aborting if malformed."""
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+    description = f"Invalid {name}: {raw}."
+    try:
+        value = int(raw)
+    except ValueError:
+        abort(400, description=description)
+    if value < 0:
+        abort(400, description=description)
+    return value
+
+
+@dataclass(slots=True, frozen=True)
+class QueryParams:
+    """Query string arguments used to filter, sort and paginate model instances."""
+
+    where: str | None = None
+    order_by: str | None = None
+    limit: int | None = None
+    offset: int | None = None
+
+
+@dataclass(slots=True)
+class _ModelIndex:
+    """Artefacts built once from the model of a model viewset class."""
+
+    model: type[Model]
+    where_cache_size: int | None
+    columns: dict[str, Any]
+    primary_key: tuple[str, ...]
+    select: Select[tuple[Any]]
+    parse_where: Callable[[str], ColumnElement[bool]]
+    parse_order_by: Callable[[str], tuple[ColumnExpressionArgument[Any], ...]] = field(
+        init=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.parse_order_by = lru_cache(maxsize=128)(self._parse_order_by)
+
+    @classmethod
+    def build(cls, model: type[Model], where_cache_size: int | None) -> _ModelIndex:
+        """Index the columns of the model and bind the where and order by parsers to it.
+
+        Parsed clauses are cached per index, SQLAlchemy clause elements being safe to
+        reuse across statements, so that the query strings of one viewset do not evict
+        the clauses of another and the caches do not outlive the viewset.
+        """
+        mapper = sqla_inspect(model, raiseerr=True)
+        names = {column: name for name, column in mapper.columns.items()}
+        return cls(
+            model=model,
+            where_cache_size=where_cache_size,
+            columns={name: getattr(model, name) for name in names.values()},
+            primary_key=tuple(names[column] for column in mapper.primary_key),
+            select=select(model),
+            parse_where=lru_cache(maxsize=where_cache_size)(WhereParser(model).parse),
+        )
+
+    def column(self, name: str) -> Any:  # noqa: ANN401
+        """Return the model column with the given name, or None if there is none."""
+        column = self.columns.get(name)
+        if column is None:
+            column = _get_column(self.model, name)
+        return column
+
+    def _parse_order_by(
+        self,
+        order_by: str,
+    ) -> tuple[ColumnExpressionArgument[Any], ...]:
+        """Return the order by clause parsed from the order_by query argument."""
+        clauses: list[ColumnExpressionArgument[Any]] = []
+        for field_ in order_by.split(","):
+            name = field_.removeprefix("-")
+            descending = name != field_
+            column = self.column(name)
+            if column is None:
+                abort(400, description=f"Unknown column: {name}.")
+            clauses.append(column.desc() if descending else column)
+        return tuple(clauses)
+
+
+class ModelViewSet[M: Model](ViewSet, metaclass=ABCMeta):
+    """A viewset that provides default implementations for model CRUD operations."""
+
+    model: type[M]  # ClassVar[type[M]]
+    schema_cls: ModelSchema[M] | type[ModelSchema[M]]  # ClassVar[type[ModelSchema[M]]]
+    db: SQLAlchemy
+    ma: Marshmallow
+    where_cache_size: ClassVar[int | None] = 256
+    shared_schema: ClassVar[bool] = False
+    yield_per: ClassVar[int | None] = None
+    _lookup_identity: ClassVar[bool] = False
+    _model_index: ClassVar[_ModelIndex | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Check the subclass and whether it overrides the where clause.
+
+        Raises:
+            TypeError: If `init_every_request` is unset, the schema and the query
+                parameters being cached on the instance for the current request.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if not cls.init_every_request:
+            msg = f"{cls.__name__} holds request state and needs init_every_request."
+            raise TypeError(msg)
+        cls._lookup_identity = cls.where_clause is ModelViewSet.where_clause
+
+    @classmethod
+    def _get_model_index(cls) -> _ModelIndex:
+        """Return the index of the model, built once per model and where cache size.
+
+        It is resolved from the model of the class when first used rather than when the
+        class is created, so that models given by mixins or set afterwards are indexed,
+        and rebuilt when a subclass changes the model or the where cache size.
+        """
+        index = cls._model_index
+        if (
+            index is None
+            or index.model is not cls.model
+            or index.where_cache_size != cls.where_cache_size
+        ):
+            index = cls._model_index = _ModelIndex.build(
+                cls.model,
+                cls.where_cache_size,
+            )
+        return index
+
+    @cached_property
+    def _index(self) -> _ModelIndex:
+        """Return the index of the model, resolved once per request."""
+        return self._get_model_index()
+
+    @cached_property
+    def schema(self) -> ModelSchema[M]:
+        """Return the schema instance, resolved once per request."""
+        return self.get_schema()
+
+    @cached_property
+    def query_params(self) -> QueryParams:
+        """Return the query string arguments of the request, read once per request."""
+        args = request.args
+        return QueryParams(
+            where=args.get("where"),
+            order_by=args.get("order_by"),
+            limit=_get_count_arg("limit"),
+            offset=_get_count_arg("offset"),
+        )
+
+    @classmethod
+    def _column(cls, name: str) -> Any:  # noqa: ANN401
+        """Return the model column with the given name, or None if there is none."""
+        return cls._get_model_index().column(name)
+
+    @property
+    def where_clause(self) -> tuple[ColumnExpressionArgument[bool], ...]:
+        """Build the where clause for request arguments based filtering.
+
+        Raises:
+            RuntimeError: If a view argument is not a column of the model, the route
+                not matching the viewset.
+
+        """
+        view_args = request.view_args or {}
+        where = self.query_params.where
+        if not (view_args or where):
+            return ()
+        clauses: list[ColumnExpressionArgument[bool]] = []
+        for name, value in view_args.items():
+            column = self._column(name)
+            if column is None:
+                msg = f"View argument {name} is not a column of {self.model.__name__}."
+                raise RuntimeError(msg)
+            clauses.append(column == value)
+        if where:
+            try:
+                clauses.append(self._index.parse_where(where))
+            except WhereSyntaxError as e:
+                abort(400, description=str(e))
+        return tuple(clauses)
+
+    @property
+    def order_by_clause(self) -> tuple[ColumnExpressionArgument[Any], ...]:
+        """Build the order by clause for request arguments based sorting."""
+        if order_by := self.query_params.order_by:
+            return self._index.parse_order_by(order_by)
+        return ()
+
+    @property
+    def limit(self) -> int | None:
+        """Return the limit for the query from request arguments."""
+        requested_limit = self.query_params.limit
+        max_limit = self.vs.config.get("max_limit")
+        if requested_limit is None:
+            return max_limit
+        if max_limit is None:
+            return requested_limit
+        return min(requested_limit, max_limit)
+
+    @property
+    def offset(self) -> int | None:
+        """Return the offset for the query from request arguments."""
+        return self.query_params.offset
+
+    def get_schema(self) -> ModelSchema[M]:
+        """Return the schema instance.
+
+        A schema class is instantiated once per thread and reused by the following
+        requests. It is not shared between threads as marshmallow-sqlalchemy schemas
+        hold the instance being loaded as state, unless `shared_schema` is set for
+        viewsets whose schema is stateless, e.g. only dumping instances. Schemas are
+        cached by viewset class, which they do not reference, so that they are
+        collected with it.
+        """
+        if not isinstance(self.schema_cls, type):
+            return self.schema_cls
+        schemas: WeakKeyDictionary[type[ModelViewSet[Any]], ModelSchema[M]]
+        if self.shared_schema:
+            schemas = _shared_schemas
+        else:
+            try:
+                schemas = _local.schemas
+            except AttributeError:
+                schemas = _local.schemas = WeakKeyDictionary()
+        key = type(self)
+        schema = schemas.get(key)
+        if schema is None:
+            schema = schemas[key] = self.schema_cls()
+        return schema
+
+    def get_instances(self) -> Iterable[M]:
+        """Return the instances based on the query.
+
+        The instances are loaded at once into a list. When `yield_per` is set, they are
+        streamed from the database by batches of `yield_per` rows instead, as a result
+        that can be iterated only once. Streaming does not support models
+        eagerly loading collections, e.g. through subquery or joined relationships.
+        """
+        stmt = self._index.select
+        if where_clause := self.where_clause:
+            stmt = stmt.where(*where_clause)
+        if order_by_clause := self.order_by_clause:
+            stmt = stmt.order_by(*order_by_clause)
+        if (limit := self.limit) is not None:
+            stmt = stmt.limit(limit)
+        if (offset := self.offset) is not None:
+            stmt = stmt.offset(offset)
+        if self.yield_per is None:
+            return self.db.session.scalars(stmt).all()
+        return self.db.session.scalars(stmt.execution_options(yield_per=self.yield_per))
+
+    def get_instance(self) -> M:
+        """Return the instance based on the query.
+
+        When the view arguments are exactly the primary key of the model and no where
+        query argument is given, the instance is looked up by its identity, from the
+        session identity map first, unless `where_clause` is overridden, e.g. to
+        restrict the rows a viewset exposes.
+        """
+        session = self.db.session
+        view_args = request.view_args or {}
+        index = self._index
+        if (
+            self._lookup_identity
+            and index.primary_key
+            and view_args.keys() == set(index.primary_key)
+            and not self.query_params.where
+        ):
+            identity = tuple(view_args[name] for name in index.primary_key)
+            instance = session.get(self.model, identity)
+            if instance is None:
+                abort(404)
+            return instance
+        stmt = index.select.where(*self.where_clause)
+        try:
+            return session.scalars(stmt).one()
+        except NoResultFound:
+            abort(404)
+        except MultipleResultsFound:
+            abort(500)
+
+    def dump(self, instance: M | Sequence[M]) -> dict[str, Any] | list[dict[str, Any]]:
+        """Serialize the instance or the list or tuple of instances using the schema.
+
+        The actions call `dump_one` or `dump_many` directly, this being kept for
+        compatibility.
+        """
+        instance_type = type(instance)
+        if instance_type is list or instance_type is tuple:
+            return self.dump_many(cast("Sequence[M]", instance))
+        return self.dump_one(cast(M, instance))
+
+    def dump_one(self, instance: M) -> dict[str, Any]:
+        """Serialize the instance using the schema."""
+        return self.schema.dump(instance)  # type: ignore[partially-unknown]
+
+    def dump_many(self, instances: Iterable[M]) -> list[dict[str, Any]]:
+        """Serialize the instances using the schema."""
+        return self.schema.dump(instances, many=True)  # type: ignore[partially-unknown]
+
+    def persist_new(self, instance: M) -> None:
+        """Add a new instance to the session, without committing it."""
+        self.db.session.add(instance)
+
+    def persist_update(self, instance: M) -> None:
+        """Register the changes of an instance, without committing them.
+
+        Instances loaded from the session are tracked by it, so this does nothing by
+        default.
+        """
+
+    def persist_delete(self, instance: M) -> None:
+        """Mark an instance for deletion, without committing it."""
+        self.db.session.delete(instance)
+
+    def finalize_write(self) -> None:
+        """Commit the writes of the action.
+
+        Actions writing several instances, e.g. bulk ones, can persist each of them and
+        finalize the write once, committing them in a single transaction.
+        """
+        self.db.session.commit()
+
+    def create(self) -> ResponseReturnValue:
+        """Create a new instance of the model."""
+        data = request.get_json()
+        schema = self.schema
+        instance = cast(M, schema.load(data))  # type: ignore[partially-unknown]
+        self.persist_new(instance)
+        self.finalize_write()
+        return self.dump_one(instance), 201
+
+    def list(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
+        """List serialized instances of the model."""
+        instances = self.get_instances()
+        return self.dump_many(instances), 200
+
+    def retrieve(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
+        """Retrieve an existing instance of the model."""
+        instance = self.get_instance()
+        return self.dump_one(instance), 200
+
+    def update(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
+        """Update an existing instance of the model."""
+        data = request.get_json()
+        schema = self.schema
+        instance = self.get_instance()
+        instance = cast(M, schema.load(data, instance=instance))  # type: ignore[partially-unknown]
+        self.persist_update(instance)
+        self.finalize_write()
+        return self.dump_one(instance), 200
+
+    def partial_update(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
+        """Update partially an existing instance of the model."""
+        data = request.get_json()
+        schema = self.schema
+        instance = self.get_instance()
+        instance = cast(M, schema.load(data, instance=instance, partial=True))  # type: ignore[partially-unknown]
+        self.persist_update(instance)
+        self.finalize_write()
+        return self.dump_one(instance), 200
+
+    def destroy(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
+        """Delete an existing instance of the model."""
+        instance = self.get_instance()
+        self.persist_delete(instance)
+        self.finalize_write()
+        return b"", 204
@@ -4,31 +4,227 @@
 # ruff: noqa: D107
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import operator
+import re
+from typing import TYPE_CHECKING, Any
 
-from lark import Lark
-
-from .transformers import WhereTransformer
+from sqlalchemy import ColumnOperators, and_, not_, or_
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.orm import RelationshipProperty
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sqlalchemy import ColumnElement
 
     from flask_viewsets.typing import Model
 
-GRAMMARS_DIR = Path(__file__).parent / "grammars"
+type Value = None | bool | float | int | str | list[Value] | dict[str, Value]
+type Token = tuple[str, str, int]
+
+MAX_DEPTH = 32
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<FLOAT>[+-]?(?:\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+))
+    |(?P<INT>[+-]?\d+)
+    |(?P<STRING>"(?:[^"\\]|\\.)*")
+    |(?P<NAME>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<OP>!=|>=|<=|~\*|[=><~#@|&!(){}\[\],:])
+    |(?P<WS>\s+)
+    |(?P<CHAR>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_OPENING = frozenset("([{")
+_CLOSING = frozenset(")]}")
+_KEYWORDS: dict[str, Value] = {"null": None, "true": True, "false": False}
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "~": ColumnOperators.like,
+    "~*": ColumnOperators.ilike,
+    "#": ColumnOperators.contains,
+    "@": ColumnOperators.in_,
+}
+
+
+class WhereSyntaxError(ValueError):
+    """Raised when a 'where' url param is not valid."""
+
+    def __init__(self, token: Token, reason: str = "Unexpected") -> None:
+        kind, text, position = token
+        what = "end of input" if kind == "EOF" else repr(text)
+        super().__init__(f"{reason} {what} at position {position}.")
+        self.position = position
+
+
+def _get_column(model: type[Model], name: str) -> Any:  # noqa: ANN401
+    """Return the column of the model with the given name, or None if there is none.
+
+    Relationships are not columns, SQLAlchemy failing to compare them to values.
+    """
+    column = getattr(model, name, None)
+    if not isinstance(column, ColumnOperators) or isinstance(
+        getattr(column, "property", None),
+        RelationshipProperty,
+    ):
+        return None
+    return column
 
 
 class WhereParser:
+    """Parser of the 'where' url param into SQLAlchemy expressions.
+
+    The expression is tokenized in a single pass of a regular expression, every
+    character being matched by one of its groups, and the tokens are assembled by
+    recursive descent into SQLAlchemy expressions. Operators
+    bind in this order, tightest first: comparisons, '!', '&' and '|'. Parentheses,
+    arrays and objects nest at most `MAX_DEPTH` levels deep, bounding the recursion.
+    """
+
+    __slots__ = ("model",)
+
     def __init__(self, model: type[Model]) -> None:
-        with Path.open(GRAMMARS_DIR / "where.lark") as f:
-            grammar = f.read()
-        self.lark = Lark(  # type: ignore[partially-unknown]
-            grammar,
-            parser="lalr",
-            start="where",
-            transformer=WhereTransformer(model),
-        )
+        self.model = model
 
     def parse(self, where: str) -> ColumnElement[bool]:
-        return self.lark.parse(where)  # type: ignore[not-assignable-to-return-type]
+        return self._assemble(self._tokenize(where))
+
+    @staticmethod
+    def _tokenize(where: str) -> list[Token]:
+        tokens: list[Token] = []
+        depth = 0
+        for match in _TOKEN_RE.finditer(where):
+            kind = match.lastgroup
+            text = match.group()
+            if kind == "OP":
+                if text in _OPENING:
+                    depth += 1
+                    if depth > MAX_DEPTH:
+                        token = (text, text, match.start())
+                        raise WhereSyntaxError(token, "Too deeply nested")
+                elif text in _CLOSING:
+                    depth -= 1
+                tokens.append((text, text, match.start()))
+            elif kind == "CHAR":
+                raise WhereSyntaxError((kind, text, match.start()))
+            elif kind != "WS":
+                tokens.append((kind, text, match.start()))  # type: ignore[arg-type]
+        tokens.append(("EOF", "", len(where)))
+        return tokens
+
+    def _assemble(self, tokens: list[Token]) -> ColumnElement[bool]:
+        clause, position = self._or(tokens, 0)
+        if tokens[position][0] != "EOF":
+            raise WhereSyntaxError(tokens[position])
+        return clause
+
+    def _or(self, tokens: list[Token], position: int) -> tuple[Any, int]:
+        clause, position = self._and(tokens, position)
+        if tokens[position][0] != "|":
+            return clause, position
+        clauses = [clause]
+        while tokens[position][0] == "|":
+            clause, position = self._and(tokens, position + 1)
+            clauses.append(clause)
+        return or_(*clauses), position
+
+    def _and(self, tokens: list[Token], position: int) -> tuple[Any, int]:
+        clause, position = self._not(tokens, position)
+        if tokens[position][0] != "&":
+            return clause, position
+        clauses = [clause]
+        while tokens[position][0] == "&":
+            clause, position = self._not(tokens, position + 1)
+            clauses.append(clause)
+        return and_(*clauses), position
+
+    def _not(self, tokens: list[Token], position: int) -> tuple[Any, int]:
+        start = position
+        while tokens[position][0] == "!":
+            position += 1
+        clause, end = self._atom(tokens, position)
+        if (position - start) % 2:
+            clause = not_(clause)
+        return clause, end
+
+    def _atom(self, tokens: list[Token], position: int) -> tuple[Any, int]:
+        kind, text, _ = tokens[position]
+        if kind == "(":
+            clause, position = self._or(tokens, position + 1)
+            return clause, self._expect(tokens, position, ")")
+        if kind != "NAME" or text in _KEYWORDS:
+            raise WhereSyntaxError(tokens[position], "Expected a condition instead of")
+        column = self._column(tokens[position])
+        op = _OPERATORS.get(tokens[position + 1][0])
+        if op is None:
+            raise WhereSyntaxError(tokens[position + 1])
+        operand = tokens[position + 2]
+        kind, text, _ = operand
+        if kind == "NAME" and text not in _KEYWORDS:
+            value, position = self._column(operand), position + 3
+        else:
+            value, position = self._value(tokens, position + 2)
+        try:
+            return op(column, value), position
+        except ArgumentError:
+            raise WhereSyntaxError(operand, "Invalid operand") from None
+
+    def _column(self, token: Token) -> Any:  # noqa: ANN401
+        column = _get_column(self.model, token[1])
+        if column is None:
+            raise WhereSyntaxError(token, "Unknown column")
+        return column
+
+    def _value(self, tokens: list[Token], position: int) -> tuple[Value, int]:
+        token = tokens[position]
+        kind, text, _ = token
+        if kind == "INT":
+            return int(text), position + 1
+        if kind == "FLOAT":
+            return float(text), position + 1
+        if kind == "STRING":
+            return text[1:-1], position + 1
+        if kind == "NAME" and text in _KEYWORDS:
+            return _KEYWORDS[text], position + 1
+        if kind == "[":
+            return self._array(tokens, position + 1)
+        if kind == "{":
+            return self._object(tokens, position + 1)
+        raise WhereSyntaxError(token)
+
+    def _array(self, tokens: list[Token], position: int) -> tuple[Value, int]:
+        values: list[Value] = []
+        if tokens[position][0] == "]":
+            return values, position + 1
+        while True:
+            value, position = self._value(tokens, position)
+            values.append(value)
+            if tokens[position][0] != ",":
+                return values, self._expect(tokens, position, "]")
+            position += 1
+
+    def _object(self, tokens: list[Token], position: int) -> tuple[Value, int]:
+        values: dict[str, Value] = {}
+        if tokens[position][0] == "}":
+            return values, position + 1
+        while True:
+            if tokens[position][0] != "STRING":
+                raise WhereSyntaxError(tokens[position])
+            key = tokens[position][1][1:-1]
+            position = self._expect(tokens, position + 1, ":")
+            values[key], position = self._value(tokens, position)
+            if tokens[position][0] != ",":
+                return values, self._expect(tokens, position, "}")
+            position += 1
+
+    @staticmethod
+    def _expect(tokens: list[Token], position: int, kind: str) -> int:
+        if tokens[position][0] != kind:
+            raise WhereSyntaxError(tokens[position])
+        return position + 1
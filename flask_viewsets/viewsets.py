@@ -3,6 +3,10 @@
 Classes:
     ViewSet: A base class for creating viewsets in Flask, mapping HTTP methods to class
         methods.
+    ModelViewSet: A viewset for model CRUD operations, imported from the
+        model_viewsets module on first access.
+    QueryParams: The query string arguments used by model viewsets to list instances,
+        imported from the model_viewsets module on first access.
 
 Type Aliases:
     RouteDecorator: A callable that takes a RouteCallable and returns a RouteCallable.
@@ -11,36 +15,121 @@ Type Aliases:
 
 from __future__ import annotations
 
+import types
 from abc import ABCMeta
-from collections.abc import Generator, Sequence
+from functools import reduce, wraps
+from importlib import import_module
+from inspect import iscoroutinefunction, markcoroutinefunction
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from flask import abort, current_app, request
 from flask.views import View
-from sqlalchemy import ColumnExpressionArgument, select
-from sqlalchemy.exc import MultipleResultsFound, NoResultFound
-
-from .parsers import WhereParser
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from flask.typing import ResponseReturnValue, RouteCallable
-    from flask_marshmallow import Marshmallow
-    from flask_sqlalchemy import SQLAlchemy
 
     from flask_viewsets.extension import ViewSets
-    from flask_viewsets.typing import Model, ModelSchema
 
+    from .model_viewsets import ModelViewSet, QueryParams  # noqa: F401
     from .typing import ConverterType, RouteDecorator
 
+_LAZY_ATTRIBUTES = {"ModelViewSet": ".model_viewsets", "QueryParams": ".model_viewsets"}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the model viewsets attributes on first access (PEP 562).
+
+    They depend on SQLAlchemy, which is thus only imported when they are used.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _ensure_sync[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Return the function, wrapped to be run by the app when it is a coroutine one."""
+    if not iscoroutinefunction(func):
+        return func
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return current_app.ensure_sync(func)(*args, **kwargs)
+
+    return wrapper
+
+
+def _action_function(
+    cls: type[ViewSet],
+    action: str,
+    attr: Any,  # noqa: ANN401
+) -> Callable[..., ResponseReturnValue]:
+    """Return a function calling the action with the viewset as first argument.
+
+    Functions are returned as is. Other descriptors, e.g. class and static methods, are
+    bound to the viewset on every call, as when looked up on it, while other callables
+    are called as they are.
+
+    Raises:
+        RuntimeError: If the action is not callable.
+
+    """
+    if isinstance(attr, types.FunctionType):
+        return attr
+
+    if hasattr(type(attr), "__get__"):
+        resolved = attr.__get__(None, cls)
+
+        def call(viewset: ViewSet, /, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return attr.__get__(viewset, type(viewset))(*args, **kwargs)
+
+    else:
+        resolved = attr
+
+        def call(_: ViewSet, /, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return attr(*args, **kwargs)
+
+    if not callable(resolved):
+        msg = f"{action} of {cls.__name__} is not callable"
+        raise RuntimeError(msg)  # noqa: TRY004
+    if iscoroutinefunction(resolved):
+        markcoroutinefunction(call)
+    return call
+
+
+def _decorate(
+    func: Callable[..., ResponseReturnValue],
+    decorator: RouteDecorator,
+) -> Callable[..., ResponseReturnValue]:
+    """Return the function wrapped by the action decorator.
+
+    Coroutine functions returned by decorators are handled by `_ensure_sync`.
+    """
+    return cast("Callable[..., ResponseReturnValue]", decorator(func))
+
+
+def _view_name(cls: type[ViewSet], method_actions: dict[str, str]) -> str:
+    """Return the default name of the view of the viewset for the method actions."""
+    return f"{cls.__name__}: {method_actions.keys()}"
+
 
 class ViewSet(View, metaclass=ABCMeta):
     """ViewSet class for handling HTTP method actions in a Flask application.
 
     Attributes:
         action_decorators (ClassVar[ActionDecorators]): A dictionary of decorators to be
-            applied to actions.
+            applied to actions, the first one being the innermost. They are read and
+            applied once, when the view is generated, to the functions defined on the
+            class, the viewset instance being passed as first positional argument to
+            the decorated function.
+        init_every_request (ClassVar[bool]): Whether a viewset instance is created for
+            every request, as for Flask views. Viewsets whose actions keep no state on
+            the instance can set it to False, a single instance being then created by
+            `as_view` and used by every request of the view.
 
     Methods:
         __init__(method_actions: dict[str, str]) -> None:
@@ -57,6 +146,7 @@ class ViewSet(View, metaclass=ABCMeta):
     action_decorators: ClassVar[dict[str, Iterable[RouteDecorator]]] = {}
     method_actions: dict[str, str]
     vs: ViewSets
+    _dispatch_table: ClassVar[dict[str, Callable[..., ResponseReturnValue]]] = {}
 
     def __init__(self, method_actions: dict[str, str]) -> None:
         """Initialize the viewset with the given method actions.
@@ -72,12 +162,11 @@ class ViewSet(View, metaclass=ABCMeta):
     def dispatch_request(self, **kwargs: ConverterType) -> ResponseReturnValue:
         """Dispatches request to appropriate handler method based on HTTP method.
 
-        This method determines the action to be taken based on the HTTP method of the
-        request. If the action is not defined for the HTTP method, it will check if a
-        'head' request can be handled by the 'get' method. If no appropriate action is
-        found, it aborts with a 405 status code. If the action is found but not defined
-        on the class, it raises a RuntimeError. If there are any decorators specified
-        for the action, they are applied to the handler method.
+        The handler of the HTTP method of the request is looked up in the dispatch
+        table built by `as_view`, keyed by the uppercase HTTP methods as given by
+        Werkzeug, 'HEAD' requests being handled by the 'get' action when no 'head'
+        action is defined. If no handler is found, it aborts with a 405
+        status code.
 
         Args:
             **kwargs: Arbitrary keyword arguments that are passed to the handler method.
@@ -85,30 +174,13 @@ class ViewSet(View, metaclass=ABCMeta):
         Returns:
             ResponseReturnValue: The response from the handler method.
 
-        Raises:
-            RuntimeError: If the action is not defined on the class.
-
         """
-        method = request.method.lower()
-        action = self.method_actions.get(method)
+        handler = self._dispatch_table.get(request.method)
 
-        if action is None and method == "head":
-            action = self.method_actions.get("get")
-
-        if action is None:
+        if handler is None:
             abort(405)
 
-        func: RouteCallable | None = getattr(self, action, None)
-
-        if func is None:
-            msg = f"{action} not defined on {self.__class__.__name__}"
-            raise RuntimeError(msg)
-
-        if action in self.action_decorators:
-            for decorator in self.action_decorators[action]:
-                func = decorator(func)
-
-        return current_app.ensure_sync(func)(**kwargs)
+        return handler(self, **kwargs)
 
     @classmethod
     def as_view(
@@ -118,134 +190,70 @@ class ViewSet(View, metaclass=ABCMeta):
         name: str | None = None,
         **class_kwargs: Any,
     ) -> RouteCallable:
-        cls.methods = {*method_actions.keys()}
-        if "get" in method_actions:
-            cls.methods.add("head")
-        name = name or f"{cls.__name__}: {method_actions.keys()}"
-        return super().as_view(name, method_actions, *class_args, **class_kwargs)
-
-
-class ModelViewSet[M: Model](ViewSet, metaclass=ABCMeta):
-    """A viewset that provides default implementations for model CRUD operations."""
-
-    model: type[M]  # ClassVar[type[M]]
-    schema_cls: ModelSchema[M] | type[ModelSchema[M]]  # ClassVar[type[ModelSchema[M]]]
-    db: SQLAlchemy
-    ma: Marshmallow
-
-    @property
-    def schema(self) -> ModelSchema[M]:
-        """Return the schema instance."""
-        return self.get_schema()
-
-    @property
-    def where_clause(self) -> Generator[ColumnExpressionArgument[bool], None, None]:
-        """Generate the where clause for request arguments based filtering."""
-        if request.view_args:
-            for name, value in request.view_args.items():
-                yield getattr(self.model, name) == value
-        if where := request.args.get("where"):
-            yield WhereParser(model=self.model).parse(where)
-
-    @property
-    def order_by_clause(self) -> Generator[ColumnExpressionArgument[Any], None, None]:
-        """Generate the order by clause for request arguments based sorting."""
-        if order_by := request.args.get("order_by"):
-            for field in order_by.split(","):
-                if field.startswith("-"):
-                    yield getattr(self.model, field[1:]).desc()
-                else:
-                    yield getattr(self.model, field)
-
-    @property
-    def limit(self) -> int | None:
-        """Return the limit for the query from request arguments."""
-        requested_limit = request.args.get("limit", type=int)
-        max_limit = self.vs.config.get("max_limit")
-        return (
-            min(requested_limit, max_limit)
-            if (requested_limit and max_limit)
-            else (max_limit or requested_limit)
-        )
+        """Generate a view function dispatching HTTP methods to actions.
+
+        The functions of the actions are resolved and wrapped by their action
+        decorators once, into a dispatch table held by a subclass dedicated to the
+        view, so that a viewset can be registered on several routes. Actions are
+        looked up in the namespaces of the class and its bases, so they have to be
+        defined there, attributes provided by a metaclass `__getattr__` not being
+        found.
 
-    @property
-    def offset(self) -> int | None:
-        """Return the offset for the query from request arguments."""
-        return request.args.get("offset", type=int)
-
-    def get_schema(self) -> ModelSchema[M]:
-        """Return the schema instance."""
-        if not isinstance(self.schema_cls, type):
-            return self.schema_cls
-        return self.schema_cls()
-
-    def get_instances(self) -> Sequence[M]:
-        """Return the instances based on the query."""
-        stmt = (
-            select(self.model)
-            .where(*self.where_clause)
-            .order_by(*self.order_by_clause)
-            .limit(self.limit)
-            .offset(self.offset)
+        The `view_class` of the returned view is therefore a subclass of the viewset,
+        sharing its name and docstring, and `__init_subclass__` hooks of the viewset
+        run once per call.
+
+        Args:
+            method_actions (dict[str, str]): A dictionary mapping HTTP methods to action
+                names.
+            *class_args: Positional arguments passed to the viewset constructor.
+            name (str | None): The name of the view, generated if not given.
+            **class_kwargs: Keyword arguments passed to the viewset constructor.
+
+        Returns:
+            RouteCallable: The view function.
+
+        Raises:
+            RuntimeError: If an action is not defined on the class or its bases, or is
+                not callable.
+
+        """
+        dispatch_table: dict[str, Callable[..., ResponseReturnValue]] = {}
+        for method, action in method_actions.items():
+            attr = next(
+                (
+                    klass.__dict__[action]
+                    for klass in cls.__mro__
+                    if action in klass.__dict__
+                ),
+                None,
+            )
+            if attr is None:
+                msg = f"{action} not defined on {cls.__name__}"
+                raise RuntimeError(msg)
+            func = _action_function(cls, action, attr)
+            dispatch_table[method.upper()] = _ensure_sync(
+                reduce(_decorate, cls.action_decorators.get(action, ()), func),
+            )
+        if "GET" in dispatch_table:
+            dispatch_table.setdefault("HEAD", dispatch_table["GET"])
+
+        view_cls = types.new_class(
+            cls.__name__,
+            (cls,),
+            exec_body=lambda ns: ns.update(
+                __module__=cls.__module__,
+                __qualname__=cls.__qualname__,
+                __doc__=cls.__doc__,
+                _dispatch_table=dispatch_table,
+                methods={*dispatch_table},
+            ),
+        )
+        if name is None:
+            name = _view_name(cls, method_actions)
+        return super(ViewSet, cast("type[ViewSet]", view_cls)).as_view(
+            name,
+            method_actions,
+            *class_args,
+            **class_kwargs,
         )
-        return self.db.session.execute(stmt).scalars().all()
-
-    def get_instance(self) -> M:
-        """Return the instance based on the query."""
-        stmt = select(self.model).where(*self.where_clause)
-        try:
-            instance = self.db.session.execute(stmt).scalars().one()
-        except NoResultFound:
-            self.db.session.rollback()
-            abort(404)
-        except MultipleResultsFound:
-            self.db.session.rollback()
-            abort(500)
-        return instance
-
-    def dump(self, instance: M | Sequence[M]) -> dict[str, Any] | list[dict[str, Any]]:
-        """Serialize the instance or instances using the schema."""
-        if isinstance(instance, Sequence):
-            return self.schema.dump(instance, many=True)  # type: ignore[partially-unknown]
-        return self.schema.dump(instance)  # type: ignore[partially-unknown]
-
-    def create(self) -> ResponseReturnValue:
-        """Create a new instance of the model."""
-        data = request.get_json()
-        instance = cast(M, self.schema.load(data))  # type: ignore[partially-unknown]
-        self.db.session.add(instance)
-        self.db.session.commit()
-        return self.dump(instance), 201
-
-    def list(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
-        """List serialized instances of the model."""
-        instances = self.get_instances()
-        return self.dump(instances), 200
-
-    def retrieve(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
-        """Retrieve an existing instance of the model."""
-        instance = self.get_instance()
-        return self.dump(instance), 200
-
-    def update(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
-        """Update an existing instance of the model."""
-        data = request.get_json()
-        instance = self.get_instance()
-        instance = cast(M, self.schema.load(data, instance=instance))  # type: ignore[partially-unknown]
-        self.db.session.commit()
-        return self.dump(instance), 200
-
-    def partial_update(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
-        """Update partially an existing instance of the model."""
-        data = request.get_json()
-        instance = self.get_instance()
-        instance = cast(M, self.schema.load(data, instance=instance, partial=True))  # type: ignore[partially-unknown]
-        self.db.session.commit()
-        return self.dump(instance), 200
-
-    def destroy(self, **_: Any) -> ResponseReturnValue:  # noqa: ANN401
-        """Delete an existing instance of the model."""
-        instance = self.get_instance()
-        self.db.session.delete(instance)
-        self.db.session.commit()
-        return b"", 204
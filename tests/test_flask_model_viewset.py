@@ -1,20 +1,26 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
 import pytest
-from flask import Flask
+from flask import Flask, request
 from flask_marshmallow import Marshmallow
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 from flask_viewsets import ViewSets
+from flask_viewsets.model_viewsets import _shared_schemas
 from flask_viewsets.typing import Model, ModelSchema
 from flask_viewsets.viewsets import ModelViewSet
 
 if TYPE_CHECKING:
     from flask.typing import ResponseReturnValue
+    from sqlalchemy import ColumnExpressionArgument
 
 
 @pytest.fixture
@@ -80,11 +86,8 @@ def test_model_viewset[M: Model](
         model = m
         schema_cls = s
 
-    app.add_url_rule(
-        "/tests",
-        endpoint="tests",
-        view_func=TestViewSet.as_view({"get": "list"}),
-    )
+    list_view = TestViewSet.as_view({"get": "list"})
+    app.add_url_rule("/tests", endpoint="tests", view_func=list_view)
     app.add_url_rule(
         "/tests/<int:id>",
         endpoint="test",
@@ -96,11 +99,236 @@ def test_model_viewset[M: Model](
     where = quote("id=0")
     response = client.get(f"/tests?where={where}")
     assert response.json == [{"id": 0}]
+    index = list_view.view_class._get_model_index()  # type: ignore[attr-defined]  # noqa: SLF001
+    cache_info = index.parse_where.cache_info
+    hits = cache_info().hits
+    response = client.get(f"/tests?where={where}&offset=1")
+    assert response.json == []
+    assert cache_info().hits == hits + 1
     order_by = quote("-id")
     response = client.get(f"/tests?order_by={order_by}")
     assert response.json == [{"id": 1}, {"id": 0}]
+    response = client.get("/tests?limit=1")
+    assert response.json == [{"id": 0}]
+    response = client.get("/tests?limit=1&offset=1")
+    assert response.json == [{"id": 1}]
+    response = client.get("/tests?limit=-1")
+    assert response.status_code == 400
+    response = client.get("/tests?offset=one")
+    assert response.status_code == 400
+    response = client.get("/tests?order_by=bogus")
+    assert response.status_code == 400
+    response = client.get(f"/tests?where={quote('bogus=1')}")
+    assert response.status_code == 400
+    response = client.get(f"/tests?where={quote('id=(')}")
+    assert response.status_code == 400
     response = client.get("/tests/0")
     assert response.json == {"id": 0}
+    response = client.get("/tests/2")
+    assert response.status_code == 404
+    response = client.get(f"/tests/0?where={quote('id=1')}")
+    assert response.status_code == 404
+
+
+def test_model_viewset_errors[M: Model](
+    db: SQLAlchemy,
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    vs = ViewSets(app)
+
+    with app.app_context():
+        db.create_all()
+
+    m = model
+    s = schema_cls
+
+    class TestViewSet(vs.ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+    app.add_url_rule("/tests", view_func=TestViewSet.as_view({"get": "list"}))
+    app.add_url_rule(
+        "/bogus/<int:bogus>",
+        view_func=TestViewSet.as_view({"get": "list"}, name="bogus"),
+    )
+    client = app.test_client()
+    response = client.get(f"/tests?where={quote('id@1')}")
+    assert response.status_code == 400
+    response = client.get("/tests?where=1")
+    assert response.status_code == 400
+    response = client.get("/bogus/0")
+    assert response.status_code == 500
+
+
+def test_model_viewset_where_clause_override[M: Model](
+    db: SQLAlchemy,
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    vs = ViewSets(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(model(id=0))  # type: ignore[arg-type]
+        db.session.add(model(id=1))  # type: ignore[arg-type]
+        db.session.commit()
+
+    m = model
+    s = schema_cls
+
+    class TestViewSet(vs.ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+        @property
+        def where_clause(self) -> tuple[ColumnExpressionArgument[bool], ...]:
+            return (*super().where_clause, m.id != 1)  # type: ignore[attr-defined]
+
+    app.add_url_rule(
+        "/tests/<int:id>",
+        view_func=TestViewSet.as_view({"get": "retrieve", "delete": "destroy"}),
+    )
+    client = app.test_client()
+    response = client.get("/tests/0")
+    assert response.json == {"id": 0}
+    response = client.get("/tests/1")
+    assert response.status_code == 404
+    response = client.delete("/tests/1")
+    assert response.status_code == 404
+
+
+def test_model_viewset_yield_per[M: Model](
+    db: SQLAlchemy,
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    vs = ViewSets(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(model(id=0))  # type: ignore[arg-type]
+        db.session.add(model(id=1))  # type: ignore[arg-type]
+        db.session.commit()
+
+    m = model
+    s = schema_cls
+
+    class TestViewSet(vs.ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+    class StreamingViewSet(TestViewSet):
+        yield_per = 1
+
+    with app.test_request_context("/tests"):
+        assert isinstance(TestViewSet({}).get_instances(), list)
+    app.add_url_rule(
+        "/tests",
+        view_func=StreamingViewSet.as_view({"get": "list"}),
+    )
+    response = app.test_client().get("/tests")
+    assert response.json == [{"id": 0}, {"id": 1}]
+
+
+def test_model_viewset_bulk_write[M: Model](
+    db: SQLAlchemy,
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    vs = ViewSets(app)
+
+    with app.app_context():
+        db.create_all()
+
+    m = model
+    s = schema_cls
+
+    class TestViewSet(vs.ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+        def bulk_create(self) -> ResponseReturnValue:
+            instances = [m(**data) for data in request.get_json()]
+            for instance in instances:
+                self.persist_new(instance)
+            self.finalize_write()
+            return self.dump_many(instances), 201
+
+    app.add_url_rule(
+        "/tests",
+        view_func=TestViewSet.as_view({"get": "list", "post": "bulk_create"}),
+    )
+    client = app.test_client()
+    commits: list[object] = []
+    on_commit = commits.append
+    event.listen(db.session, "after_commit", on_commit)
+    try:
+        response = client.post("/tests", json=[{"id": 0}, {"id": 1}, {"id": 2}])
+    finally:
+        event.remove(db.session, "after_commit", on_commit)
+    assert response.status_code == 201
+    assert len(commits) == 1
+    response = client.get("/tests")
+    assert response.json == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_model_viewset_inherited_model[M: Model](
+    db: SQLAlchemy,
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    vs = ViewSets(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(model(id=0))  # type: ignore[arg-type]
+        db.session.commit()
+
+    m = model
+    s = schema_cls
+
+    class ModelMixin:
+        model = m
+        schema_cls = s
+
+    class MixinViewSet(ModelMixin, vs.ModelViewSet[M]):  # type: ignore[misc]
+        pass
+
+    class LateViewSet(vs.ModelViewSet[M]):
+        schema_cls = s
+
+    LateViewSet.model = m
+
+    class CachedViewSet(MixinViewSet):
+        where_cache_size = 1
+
+    for name, viewset in (
+        ("mixin", MixinViewSet),
+        ("late", LateViewSet),
+        ("cached", CachedViewSet),
+    ):
+        app.add_url_rule(
+            f"/{name}",
+            view_func=viewset.as_view({"get": "list"}, name=f"{name}-list"),
+        )
+        app.add_url_rule(
+            f"/{name}/<int:id>",
+            view_func=viewset.as_view({"get": "retrieve"}, name=name),
+        )
+    client = app.test_client()
+    for name in ("mixin", "late", "cached"):
+        response = client.get(f"/{name}?where=id=0")
+        assert response.json == [{"id": 0}]
+        response = client.get(f"/{name}/0")
+        assert response.json == {"id": 0}
+    index = CachedViewSet._get_model_index()  # noqa: SLF001
+    assert index.parse_where.cache_info().maxsize == 1  # type: ignore[attr-defined]
 
 
 def test_base_model_viewset[M: Model](
@@ -162,3 +390,79 @@ def test_base_model_viewset[M: Model](
     assert response.json == {"id": 0}
     response = client.post("/tests/action")
     assert response.json == {"message": "action"}
+
+
+def test_model_viewset_init_every_request() -> None:
+    with pytest.raises(TypeError):
+
+        class TestViewSet(ModelViewSet[Model]):
+            init_every_request = False
+
+
+def test_model_viewset_shared_schema[M: Model](
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    m = model
+    s = schema_cls
+
+    class TestViewSet(ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+    class SharedViewSet(TestViewSet):
+        shared_schema = True
+
+    def get_schemas() -> tuple[ModelSchema[M], ModelSchema[M]]:
+        return TestViewSet({}).get_schema(), SharedViewSet({}).get_schema()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        schema, shared = executor.submit(get_schemas).result()
+    assert get_schemas()[0] is not schema
+    assert get_schemas()[0] is get_schemas()[0]
+    assert get_schemas()[1] is shared
+
+
+def test_model_viewset_schema_collected[M: Model](
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    m = model
+    s = schema_cls
+
+    class TestViewSet(ModelViewSet[M]):
+        model = m
+        schema_cls = s
+        shared_schema = True
+
+    gc.collect()
+    cached = len(_shared_schemas)
+    assert isinstance(TestViewSet({}).get_schema(), schema_cls)
+    assert len(_shared_schemas) == cached + 1
+    ref = weakref.ref(TestViewSet)
+    del TestViewSet
+    gc.collect()
+    assert ref() is None
+    assert len(_shared_schemas) == cached
+
+
+def test_model_viewset_order_by_collected[M: Model](
+    app: Flask,
+    model: type[M],
+    schema_cls: type[ModelSchema[M]],
+) -> None:
+    m = model
+    s = schema_cls
+
+    class TestViewSet(ModelViewSet[M]):
+        model = m
+        schema_cls = s
+
+    with app.test_request_context("/?order_by=-id"):
+        clause = TestViewSet({}).order_by_clause
+    with app.test_request_context("/?order_by=-id"):
+        assert TestViewSet({}).order_by_clause is clause
+    ref = weakref.ref(TestViewSet)
+    del TestViewSet
+    gc.collect()
+    assert ref() is None
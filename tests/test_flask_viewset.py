@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import pytest
@@ -107,6 +108,9 @@ def test_add_viewset(client: FlaskClient):
     assert response.status_code == 200
     response = client.get("/0")
     assert response.status_code == 200
+    response = client.head("/0")
+    assert response.status_code == 200
+    assert response.data == b""
     response = client.patch("/0")
     assert response.status_code == 200
     response = client.delete("/0")
@@ -115,3 +119,117 @@ def test_add_viewset(client: FlaskClient):
     assert response.status_code == 405
     response = client.get("/to_be_decorated")
     assert response.status_code == 200
+
+
+def test_undefined_action():
+    class TestViewSet(ViewSet):
+        pass
+
+    with pytest.raises(RuntimeError):
+        TestViewSet.as_view({"get": "list"})
+
+
+def test_not_callable_action():
+    class TestViewSet(ViewSet):
+        list = None
+        retrieve = property(lambda _: None)
+
+    with pytest.raises(RuntimeError):
+        TestViewSet.as_view({"get": "list"})
+    with pytest.raises(RuntimeError):
+        TestViewSet.as_view({"get": "retrieve"})
+
+
+def test_callable_action():
+    class TestViewSet(ViewSet):
+        list = partial(lambda status: ([], status), 200)
+
+    app = Flask(__name__)
+    app.add_url_rule("/", view_func=TestViewSet.as_view({"get": "list"}))
+    response = app.test_client().get("/")
+    assert response.json == []
+
+
+def test_view_class():
+    class TestViewSet(ViewSet):
+        """Viewset documentation."""
+
+        def list(self) -> ResponseReturnValue:
+            return [], 200
+
+    view = TestViewSet.as_view({"get": "list"})
+    assert view.__doc__ == "Viewset documentation."
+    assert issubclass(view.view_class, TestViewSet)  # type: ignore[attr-defined]
+    assert view.view_class.__name__ == "TestViewSet"  # type: ignore[attr-defined]
+
+
+def test_class_and_static_method_actions():
+    class TestViewSet(ViewSet):
+        action_decorators: ClassVar[dict[str, Iterable[RouteDecorator]]] = {
+            "retrieve": (lambda f: f,),
+        }
+
+        @classmethod
+        def list(cls) -> ResponseReturnValue:
+            return [cls.__name__], 200
+
+        @staticmethod
+        def retrieve(id_: int) -> ResponseReturnValue:
+            return {"id": id_}, 200
+
+    app = Flask(__name__)
+    app.add_url_rule("/", view_func=TestViewSet.as_view({"get": "list"}))
+    app.add_url_rule(
+        "/<int:id_>",
+        view_func=TestViewSet.as_view({"get": "retrieve"}, name="retrieve"),
+    )
+    client = app.test_client()
+    response = client.get("/")
+    assert response.json == ["TestViewSet"]
+    response = client.get("/0")
+    assert response.json == {"id": 0}
+
+
+def test_action_decorators_order():
+    def tag(tag_: str) -> RouteDecorator:
+        def decorator(f: RouteCallable) -> RouteCallable:
+            def decorated(*args: Any, **kwargs: Any) -> ResponseReturnValue:  # noqa: ANN401
+                return [*f(*args, **kwargs), tag_]
+
+            return decorated
+
+        return decorator
+
+    class TestViewSet(ViewSet):
+        action_decorators: ClassVar[dict[str, Iterable[RouteDecorator]]] = {
+            "list": (tag("inner"), tag("outer")),
+        }
+
+        def list(self) -> ResponseReturnValue:
+            return ["list"]
+
+    app = Flask(__name__)
+    app.add_url_rule("/", view_func=TestViewSet.as_view({"get": "list"}))
+    response = app.test_client().get("/")
+    assert response.json == ["list", "inner", "outer"]
+
+
+def test_init_once():
+    instances: list[ViewSet] = []
+
+    class TestViewSet(ViewSet):
+        init_every_request = False
+
+        def __init__(self, method_actions: dict[str, str]) -> None:
+            super().__init__(method_actions)
+            instances.append(self)
+
+        def list(self) -> ResponseReturnValue:
+            return [], 200
+
+    app = Flask(__name__)
+    app.add_url_rule("/", view_func=TestViewSet.as_view({"get": "list"}))
+    client = app.test_client()
+    client.get("/")
+    client.get("/")
+    assert len(instances) == 1
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from flask import Flask
 
@@ -12,3 +15,15 @@ def app():
 def test_model_viewset(app: Flask):
     vs = ViewSets()
     vs.init_app(app)
+
+
+def test_no_sqlalchemy_import():
+    code = (
+        "import sys\n"
+        "from flask import Flask\n"
+        "from flask_viewsets import ViewSets\n"
+        "vs = ViewSets(Flask(__name__))\n"
+        "vs.ViewSet\n"
+        "assert 'sqlalchemy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True)  # noqa: S603
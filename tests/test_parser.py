@@ -7,6 +7,7 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import (
     ColumnElement,
     Engine,
+    ForeignKey,
     Integer,
     and_,
     create_engine,
@@ -14,9 +15,9 @@ from sqlalchemy import (
     or_,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from flask_viewsets.parsers import WhereParser
+from flask_viewsets.parsers import WhereParser, WhereSyntaxError
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import CompilerElement
@@ -40,10 +41,13 @@ def model(db: SQLAlchemy) -> type[Model]:
         __tablename__ = "test"
 
         id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str | None]
         array: Mapped[list[int]] = mapped_column(
             ARRAY(Integer),
             default=lambda: [1, 2, 3],
         )
+        parent_id: Mapped[int | None] = mapped_column(ForeignKey("test.id"))
+        children = relationship("TestModel")
 
     return TestModel
 
@@ -62,13 +66,19 @@ def test_parse(engine: Engine, model: type[Model], where_parser: WhereParser):
 
     id_column = cast(ColumnElement[int], model.id)  # type: ignore[attr-defined]
     array_column = cast(ColumnElement[list[int]], model.array)  # type: ignore[attr-defined]
+    name_column = cast(ColumnElement[str], model.name)  # type: ignore[attr-defined]
 
     assert compare("id=1", id_column == 1)
     assert compare("id=null", id_column.is_(None))
     assert compare("id!=1", id_column != 1)
     assert compare("!(id=null)", id_column.is_not(None))
     assert compare("!(id=null)", not_(id_column.is_(None)))
+    assert compare("!!(id=1)", not_(not_(id_column == 1)))
+    assert compare("!" * 300 + "(id=1)", id_column == 1)
+    assert compare("(" * 32 + "id=1" + ")" * 32, id_column == 1)
     assert compare("id>1", id_column > 1)
+    assert compare("id>1.5", id_column > 1.5)
+    assert compare("id>-1e3", id_column > -1e3)
     assert compare("id>=1", id_column >= 1)
     assert compare("id<1", id_column < 1)
     assert compare("id<=1", id_column <= 1)
@@ -82,5 +92,42 @@ def test_parse(engine: Engine, model: type[Model], where_parser: WhereParser):
         "(id=1|id=2)&id=3",
         and_(or_(id_column == 1, id_column == 2), id_column == 3),
     )
+    assert compare(
+        "id=1 | id=2 | id=3",
+        or_(id_column == 1, id_column == 2, id_column == 3),
+    )
+    assert compare('name~"a%"', name_column.like("a%"))
+    assert compare('name~*"a%"', name_column.ilike("a%"))
     assert compare("array#1", array_column.contains(1))
     assert compare("id@[1,2,3]", id_column.in_([1, 2, 3]))
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        "",
+        "id",
+        "id=",
+        "id=1&",
+        "(id=1",
+        "id=1)",
+        "id$1",
+        "bogus=1",
+        "id=__table__",
+        "1",
+        '"x"',
+        "true",
+        "!1",
+        "id=1|[1]",
+        "(" * 300 + "id=1" + ")" * 300,
+        "id@" + "[" * 300 + "]" * 300,
+        "id@1",
+        "id@null",
+        "children=1",
+        "children@[1]",
+        "id=children",
+    ],
+)
+def test_parse_syntax_error(where_parser: WhereParser, where: str):
+    with pytest.raises(WhereSyntaxError):
+        where_parser.parse(where)